@@ -1,24 +1,131 @@
 #Import Modules
 import requests
+import urllib3
+import aiohttp
+import asyncio
+import itertools
 import base64 as b64
+import logging
 import pandas as pd
-import json
+import pathlib
+import threading
 import time
+import urllib.parse
+
+logger = logging.getLogger(__name__)
+
+class RateLimiter:
+    """
+    Caps concurrent requests and honors Spotify's Retry-After header on 429/503 responses
+    """
+    def __init__(self, rate = 10):
+        self.rate = rate
+        self._semaphore = None
+        self._loop = None
+        self._next_ok = 0.0
+
+    def _get_semaphore(self):
+        #Each asyncio.run call creates a fresh event loop, so re-bind the semaphore when the loop changes
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.rate)
+        return self._semaphore
+
+    async def request(self, session, method, url, **kwargs):
+        """
+        Send a rate-limited request, retrying with exponential backoff when Spotify asks us to slow down
+        """
+        delay = 1
+        for attempt in range(5):
+            async with self._get_semaphore():
+                #Respect any backoff a previous 429/503 response imposed
+                wait = self._next_ok - time.monotonic()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                async with session.request(method, url, **kwargs) as response:
+                    if response.status not in (429, 503):
+                        return response.status, await response.json()
+                    delay = int(response.headers.get('Retry-After', '1')) * 2 ** attempt
+                    self._next_ok = time.monotonic() + delay
+            await asyncio.sleep(delay)
+        raise RuntimeError(f'Request to {url} still rate-limited after 5 attempts')
 
 class SpotifyAPIClient:
+    #Where the refresh token is cached between runs to skip the interactive OAuth dance
+    _refresh_token_path = pathlib.Path('~/.spotify_api_client/refresh_token').expanduser()
+
     def __init__(self, client_id, client_secret, redirect_uri, scopes, refresh_token = None):
         #Define Class Properties
         self.client_id = client_id
         self.client_secret = client_secret
         self.redirect_uri = redirect_uri
         self.scopes = scopes
+
+        #Create a pooled session so every request reuses one keep-alive connection to Spotify
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections = 2
+            ,pool_maxsize = 64
+            ,max_retries = urllib3.util.Retry(
+                total = 5
+                ,backoff_factor = 0.5
+                ,status_forcelist = [429, 500, 502, 503, 504]
+                ,respect_retry_after_header = True
+            )
+        )
+        self.session.mount('https://', adapter)
+        self._rate_limiter = RateLimiter()
+
+        #Pre-compute the Basic auth headers shared by both token endpoints
+        self._basic_auth_headers = {
+            'Authorization' : 'Basic ' + b64.b64encode(f'{client_id}:{client_secret}'.encode()).decode()
+            ,'Content-Type' : r'application/x-www-form-urlencoded'
+        }
+
+        #Locks guaranteeing only one token refresh runs at a time (single-flight)
+        self._refresh_lock = threading.Lock()
+        self._async_refresh_lock = None
+        self._async_refresh_loop = None
+
+        #Reuse the refresh token cached by a previous run before falling back to interactive auth
         if refresh_token == None:
-            self.refresh_token = self.get_refresh_token()
-        else:
-            self.refresh_token = refresh_token
-        self.access_token, self.expiration_time = self.get_access_token()
+            refresh_token = self._load_cached_refresh_token()
+        if refresh_token == None:
+            refresh_token = self.get_refresh_token()
+        self.refresh_token = refresh_token
+        self._store_refresh_token(refresh_token)
+        self.get_access_token()
         self.user_id = self.get_user_id()
-    
+
+    @property
+    def access_token(self):
+        return self._token['value']
+
+    @property
+    def expiration_time(self):
+        return self._token['exp']
+
+    @classmethod
+    def _load_cached_refresh_token(cls):
+        """
+        Load the refresh token cached by a previous run, if any
+        """
+        try:
+            return cls._refresh_token_path.read_text().strip() or None
+        except OSError:
+            return None
+
+    @classmethod
+    def _store_refresh_token(cls, refresh_token):
+        """
+        Cache the refresh token on disk, readable by the current user only
+        """
+        cls._refresh_token_path.parent.mkdir(parents = True, exist_ok = True)
+        cls._refresh_token_path.touch(mode = 0o600, exist_ok = True)
+        cls._refresh_token_path.chmod(0o600)
+        cls._refresh_token_path.write_text(refresh_token)
+
     def get_refresh_token(self):
         """
         Generate a Refresh Token for the Spotify API
@@ -30,10 +137,6 @@ class SpotifyAPIClient:
 
         #Define POST request details
         url = r'https://accounts.spotify.com/api/token?'
-        headers = {
-            'Authorization' : 'Basic ' + b64.b64encode((self.client_id + ':' + self.client_secret).encode()).decode()
-            ,'Content-Type' : r'application/x-www-form-urlencoded'
-        }
         data = {
             'grant_type'    : 'authorization_code'
             ,'code'         : code
@@ -41,7 +144,7 @@ class SpotifyAPIClient:
         }
 
         #Generate Refresh Token
-        response = requests.post(url, headers = headers, data = data)
+        response = self.session.post(url, headers = self._basic_auth_headers, data = data)
 
         return response.json()['refresh_token']
 
@@ -51,10 +154,6 @@ class SpotifyAPIClient:
         """
         #Define POST request details
         url = r'https://accounts.spotify.com/api/token?'
-        headers = {
-            'Authorization' : 'Basic ' + b64.b64encode((self.client_id + ':' + self.client_secret).encode()).decode()
-            ,'Content-Type' : r'application/x-www-form-urlencoded'
-        }
         data = {
             'grant_type'    : 'refresh_token'
             ,'refresh_token': self.refresh_token
@@ -62,10 +161,23 @@ class SpotifyAPIClient:
         }
 
         #Generate access token
-        response = requests.post(url, headers = headers, data = data)
+        response = self.session.post(url, headers = self._basic_auth_headers, data = data)
+        payload = response.json()
+        access_token = payload['access_token']
+
+        #Spotify may rotate the refresh token; persist the replacement when it does
+        if 'refresh_token' in payload:
+            self.refresh_token = payload['refresh_token']
+            self._store_refresh_token(self.refresh_token)
 
         #Assign Access Token & expiration time to API Client properties
-        return (response.json()['access_token'], time.time() + 3600)
+        self._token = {
+            'value' : access_token
+            ,'exp'  : time.time() + 3600
+        }
+
+        #Refresh the session-wide Authorization header so call-sites stop rebuilding it
+        self.session.headers.update({'Authorization': 'Bearer ' + access_token})
 
     def check_access_token(func):
         """
@@ -74,10 +186,87 @@ class SpotifyAPIClient:
         def wrapper(self, *args, **kwargs):
             #Generate new access token if current access token is close to expiration
             if self.expiration_time - time.time() <= 600:
-                self.get_access_token()
+                with self._refresh_lock:
+                    #Re-check after acquiring the lock - another thread may have refreshed already
+                    if self.expiration_time - time.time() <= 600:
+                        self.get_access_token()
             return func(self, *args, **kwargs)
         return wrapper
 
+    @staticmethod
+    def _pack_artists(artists):
+        """
+        Pack a track's artist list into pipe-delimited (ids, names) strings in one pass
+        """
+        if len(artists) == 1:
+            artist = artists[0]
+            return artist['id'], artist['name']
+        return '|'.join(artist['id'] for artist in artists), '|'.join(artist['name'] for artist in artists)
+
+    async def _ensure_token(self):
+        """
+        Refresh the access token if it is close to expiration, letting exactly one
+        coroutine perform the refresh while the rest await its result
+        """
+        if self.expiration_time - time.time() > 60:
+            return
+
+        #Each asyncio.run call creates a fresh event loop, so re-bind the lock when the loop changes
+        loop = asyncio.get_running_loop()
+        if loop is not self._async_refresh_loop:
+            self._async_refresh_loop = loop
+            self._async_refresh_lock = asyncio.Lock()
+
+        async with self._async_refresh_lock:
+            #Another coroutine may have refreshed while we waited for the lock
+            if self.expiration_time - time.time() > 60:
+                return
+            await asyncio.to_thread(self.get_access_token)
+
+    async def _fetch_page(self, session, url, params = None):
+        """
+        Fetch a single page from an offset-paginated endpoint and return the parsed JSON payload
+        """
+        await self._ensure_token()
+        headers = {
+            'Authorization': 'Bearer ' + self.access_token
+        }
+        status, payload = await self._rate_limiter.request(
+            session, 'GET', url
+            ,headers = headers
+            ,params = None if params is None else {key: str(value) for key, value in params.items()}
+        )
+        return payload
+
+    async def _paginate(self, url, params, parse_page, session = None):
+        """
+        Fetch every page of an offset-paginated endpoint and return a list of parsed pages
+
+        The first page is fetched alone to learn the total item count, then all remaining
+        offsets are requested concurrently (throttled by the shared rate limiter). An open
+        aiohttp session may be passed in so nested fetches reuse one connection pool
+        """
+        if session is None:
+            connector = aiohttp.TCPConnector(limit_per_host = 16)
+            async with aiohttp.ClientSession(connector = connector) as session:
+                return await self._paginate(url, params, parse_page, session)
+
+        #Fetch the first page to learn the total item count and page size
+        payload = await self._fetch_page(session, url, params)
+        limit = payload['limit']
+        total = payload['total']
+        pages = [parse_page(payload)]
+
+        #Fetch all remaining pages concurrently, urlencoding the static params only once
+        base_url = url + '?' + urllib.parse.urlencode({key: value for key, value in params.items() if key != 'offset'})
+        remaining = await asyncio.gather(*[
+            self._fetch_page(session, base_url + f'&offset={offset}')
+            for offset in range(params['offset'] + limit, total, limit)
+        ])
+        pages += [parse_page(payload) for payload in remaining]
+
+        return pages
+
     @check_access_token
     def get_user_id(self):
         """
@@ -85,12 +274,9 @@ class SpotifyAPIClient:
         """
         #Define GET request details
         url = 'https://api.spotify.com/v1/me'
-        headers = {
-            'Authorization': 'Bearer ' + self.access_token
-        }
 
         #Send GET request to retrieve user ID
-        response = requests.get(url, headers = headers)
+        response = self.session.get(url)
 
         return response.json()['id']
     
@@ -99,15 +285,8 @@ class SpotifyAPIClient:
         """
         Generate a Pandas DataFrame of all the artists that the current user follows
         """
-        #Generate new access token if current access token is close to expiration
-        if self.expiration_time - time.time() <= 600:
-            self.get_access_token()
-
         #Define GET request details
         url = 'https://api.spotify.com/v1/me/following'
-        headers = {
-            'Authorization': 'Bearer ' + self.access_token
-        }
         params = {
             'type'      : 'artist'
             ,'limit'    : 50
@@ -117,22 +296,22 @@ class SpotifyAPIClient:
         #Generate full list of followed artists
         artists = []
         while True:
-            response = requests.get(url, headers = headers, params = params)
+            payload = self.session.get(url, params = params).json()['artists']
             data = [
                 {
                     'artist'    : artist['name']
                     ,'artist_id': artist['id']
                     ,'genres'   : ' | '.join(artist['genres'])
-                } 
-                for artist in response.json()['artists']['items']
+                }
+                for artist in payload['items']
             ]
             artists += data
-            if len(artists) == response.json()['artists']['total']:
+            if len(artists) == payload['total']:
                 break
             else:
                 params['after'] = data[-1]['artist_id']
-                
-        return pd.DataFrame(artists)
+
+        return pd.DataFrame.from_records(artists, columns = ('artist', 'artist_id', 'genres'))
 
     @check_access_token
     def follow_artist(self, artist_id:str):
@@ -145,22 +324,19 @@ class SpotifyAPIClient:
         """
         #Define PUT request details
         url = 'https://api.spotify.com/v1/me/following'
-        headers = {
-            'Authorization': 'Bearer ' + self.access_token
-        }
         params = {
             'type': 'artist'
             ,'ids': artist_id
         }
 
         #Send PUT request to follow artist
-        response = requests.put(url, headers = headers, params = params)
+        response = self.session.put(url, params = params)
 
         if response.status_code == 204:
             print(f'Successfully followed {artist_id}')
         else:
-            print(f'Failed to follow {artist_id}')
-            print(f'ERROR: {response.json()['error']['message']}')
+            payload = response.json()
+            logger.error('Failed to follow %s: %s', artist_id, payload.get('error', {}).get('message'))
 
     @check_access_token
     def get_current_user_playlists(self):
@@ -169,32 +345,26 @@ class SpotifyAPIClient:
         """
         #Define GET request details
         url = 'https://api.spotify.com/v1/me/playlists'
-        headers = {
-            'Authorization': 'Bearer ' + self.access_token
-        }
         params = {
             'limit'   : 50
             ,'offset' : 0
         }
 
         #Generate full list of playlists from current user
-        playlists = []
-        while True:
-            response = requests.get(url, headers = headers, params = params)
-            data = [
+        def parse_page(payload):
+            return [
                 {
                     'playlist_id'    : playlist['id']
                     ,'playlist_name' : playlist['name']
-                } 
-                for playlist in response.json()['items']
+                }
+                for playlist in payload['items']
             ]
-            playlists += data
-            if len(playlists) == response.json()['total']:
-                break
-            else:
-                params['offset'] += 50
+        pages = asyncio.run(self._paginate(url, params, parse_page))
 
-        return pd.DataFrame(playlists)
+        return pd.DataFrame.from_records(
+            itertools.chain.from_iterable(pages)
+            ,columns = ('playlist_id', 'playlist_name')
+        )
 
     @check_access_token
     def create_playlist(self, playlist_name:str, playlist_description = ''):
@@ -214,10 +384,6 @@ class SpotifyAPIClient:
 
         #Define POST request details
         url = f'https://api.spotify.com/v1/users/{self.user_id}/playlists'
-        headers = {
-            'Authorization': 'Bearer ' + self.access_token
-            ,'Content-Type': 'application/json'
-        }
         data = {
             'name'          : playlist_name
             ,'public'       : False
@@ -226,12 +392,65 @@ class SpotifyAPIClient:
         }
 
         #Send PUT reqest to create new playlist
-        response = requests.post(url, headers = headers, json = data)
+        response = self.session.post(url, json = data)
 
         if response.status_code == 201:
             print(f'Successfully created playlist {playlist_name}.')
         else:
-            print(f'Failed to create playlist {playlist_name}.')
+            payload = response.json()
+            logger.error('Failed to create playlist %s: %s', playlist_name, payload.get('error', {}).get('message'))
+
+    def _parse_playlist_page(self, playlist_id, payload):
+        """
+        Parse one page of a playlist-tracks payload into a list of track records
+        """
+        records = []
+        for item in payload['items']:
+            track = item['track']
+            artist_ids, artist_names = self._pack_artists(track['artists'])
+            records.append({
+                'playlist_id'   : playlist_id
+                ,'track_id'     : track['id']
+                ,'track_name'   : track['name']
+                ,'track_uri'    : track['uri']
+                ,'artist_ids'   : artist_ids
+                ,'artist_names' : artist_names
+                ,'album_name'   : track['album']['name']
+                ,'album_uri'    : track['album']['uri']
+                ,'added_at'     : item['added_at']
+            })
+        return records
+
+    @check_access_token
+    def iter_playlist_items(self, playlist_id:str):
+        """
+        Yield the tracks in the specified Spotify playlist one page-sized batch at a time
+
+        Streams batches of track records instead of holding the whole playlist in memory;
+        use get_playlist_items for a DataFrame of the full playlist
+
+        Parameters
+        ----------
+        playist_id : The Spotify ID of the playlist
+        """
+        #Define GET request details
+        url = f'https://api.spotify.com/v1/playlists/{playlist_id}/tracks'
+        params = {
+            'market'  : 'US'
+            ,'limit'  : 100
+            ,'offset' : 0
+            ,'fields' : 'total,limit,items(added_at,track(id,name,uri,artists(id,name),album(name,uri)))'
+        }
+
+        #Yield each page of tracks as it arrives, urlencoding the static params only once
+        base_url = url + '?' + urllib.parse.urlencode({key: value for key, value in params.items() if key != 'offset'})
+        offset = params['offset']
+        while True:
+            payload = self.session.get(base_url + f'&offset={offset}').json()
+            yield self._parse_playlist_page(playlist_id, payload)
+            offset += payload['limit']
+            if offset >= payload['total']:
+                break
 
     @check_access_token
     def get_playlist_items(self, playlist_id:str):
@@ -244,40 +463,22 @@ class SpotifyAPIClient:
         """
         #Define GET request details
         url = f'https://api.spotify.com/v1/playlists/{playlist_id}/tracks'
-        headers = {
-            'Authorization': 'Bearer ' + self.access_token
-        }
         params = {
             'market'  : 'US'
-            ,'limit'  : 50
+            ,'limit'  : 100
             ,'offset' : 0
+            ,'fields' : 'total,limit,items(added_at,track(id,name,uri,artists(id,name),album(name,uri)))'
         }
 
         #Generate full list of tracks in playlist
-        tracks = []
-        while True:
-            response = requests.get(url, headers = headers, params = params)
-            data = [
-                {
-                    'playlist_id'   : playlist_id
-                    ,'track_id'     : track['track']['id']
-                    ,'track_name'   : track['track']['name']
-                    ,'track_uri'    : track['track']['uri']
-                    ,'artist_ids'   : '|'.join([artist['id'] for artist in track['track']['artists']])
-                    ,'artist_names' : '|'.join([artist['name'] for artist in track['track']['artists']])
-                    ,'album_name'   : track['track']['album']['name']
-                    ,'album_uri'    : track['track']['album']['uri']
-                    ,'added_at'     : track['added_at']
-                } 
-                for track in response.json()['items']
-            ]
-            tracks += data
-            if len(tracks) == response.json()['total']:
-                break
-            else:
-                params['offset'] += 50
+        def parse_page(payload):
+            return self._parse_playlist_page(playlist_id, payload)
+        pages = asyncio.run(self._paginate(url, params, parse_page))
 
-        return pd.DataFrame(tracks)
+        return pd.DataFrame.from_records(
+            itertools.chain.from_iterable(pages)
+            ,columns = ('playlist_id', 'track_id', 'track_name', 'track_uri', 'artist_ids', 'artist_names', 'album_name', 'album_uri', 'added_at')
+        )
 
     @check_access_token
     def add_items_to_playlist(self, playlist_id:str, track_uris:list):
@@ -291,22 +492,37 @@ class SpotifyAPIClient:
         """
         #Define PUT request details
         url = f'https://api.spotify.com/v1/playlists/{playlist_id}/tracks'
-        headers = {
-            'Authorization': 'Bearer ' + self.access_token
-            ,'Content-Type': 'application/json'
-        }
         body = {
             'uris': track_uris
         }
 
         #Send PUT reqest to create new playlist
-        response = requests.post(url, headers = headers, data = json.dumps(body))
+        response = self.session.post(url, json = body)
 
         if response.status_code == 201:
             print(f'Successfully added all tracks to playlist {playlist_id}.')
         else:
-            print(f'Failed to add all tracks to playlist {playlist_id}.')
+            payload = response.json()
+            logger.error('Failed to add all tracks to playlist %s: %s', playlist_id, payload.get('error', {}).get('message'))
     
+    async def _add_items_async(self, session, playlist_id, track_uris):
+        """
+        Async counterpart of add_items_to_playlist; returns the response status code
+
+        Concurrent batches may land in any order, so only use this when playlist order does not matter
+        """
+        await self._ensure_token()
+        url = f'https://api.spotify.com/v1/playlists/{playlist_id}/tracks'
+        headers = {
+            'Authorization': 'Bearer ' + self.access_token
+        }
+        status, payload = await self._rate_limiter.request(
+            session, 'POST', url
+            ,headers = headers
+            ,json = {'uris': track_uris}
+        )
+        return status
+
     @check_access_token
     def get_artists_albums(self, artist_id:str):
         """
@@ -318,9 +534,6 @@ class SpotifyAPIClient:
         """        
         #Define GET request details
         url = f'https://api.spotify.com/v1/artists/{artist_id}/albums'
-        headers = {
-            'Authorization': 'Bearer ' + self.access_token
-        }
         params = {
             'include_groups': 'album,single,appears_on,compilation'
             ,'market'       : 'US'
@@ -330,10 +543,8 @@ class SpotifyAPIClient:
         }
 
         #Generate full list of albums associated with artist
-        albums = []
-        while True:
-            response = requests.get(url, headers = headers, params = params)
-            data = [
+        def parse_page(payload):
+            return [
                 {
                     'artist_id'             : artist_id
                     ,'album_name'           : album['name']
@@ -341,31 +552,22 @@ class SpotifyAPIClient:
                     ,'album_group'          : album['album_group']
                     ,'album_release_date'   : album['release_date']
                     ,'album_is_playable'    : album['is_playable']
-                } 
-                for album in response.json()['items']
+                }
+                for album in payload['items']
             ]
-            albums += data
-            if len(albums) == response.json()['total']:
-                break
-            else:
-                params['offset'] += 50
+        pages = asyncio.run(self._paginate(url, params, parse_page))
 
-        return pd.DataFrame(albums)
+        return pd.DataFrame.from_records(
+            itertools.chain.from_iterable(pages)
+            ,columns = ('artist_id', 'album_name', 'album_id', 'album_group', 'album_release_date', 'album_is_playable')
+        )
     
-    @check_access_token
-    def get_albums_tracks(self, album_id:str):
+    async def _get_albums_tracks_async(self, album_id, session = None):
+        """
+        Async counterpart of get_albums_tracks, reusing an open aiohttp session when given one
         """
-        Generate a list of dictionaries for all the tracks in the specified album
-
-        Parameters
-        ----------
-        album_id : The Spotify ID of the album
-        """  
         #Define request details
         url = f'https://api.spotify.com/v1/albums/{album_id}/tracks'
-        headers = {
-            'Authorization': 'Bearer ' + self.access_token
-        }
         params = {
             'market'    : 'US'
             ,'limit'    : 50
@@ -373,78 +575,99 @@ class SpotifyAPIClient:
         }
 
         #Generate full list of tracks associated with albums
-        tracks = []
-        while True:
-            response = requests.get(url, headers = headers, params = params)
-            data = [
-                {
+        def parse_page(payload):
+            records = []
+            for track in payload['items']:
+                artist_ids, artist_names = self._pack_artists(track['artists'])
+                records.append({
                     'album_id'            : album_id
                     ,'track_name'         : track['name']
                     ,'track_id'           : track['id']
                     ,'track_uri'          : track['uri']
-                    ,'track_artist_ids'   : '|'.join([artist['id'] for artist in track['artists']])
-                    ,'track_artist_names' : '|'.join([artist['name'] for artist in track['artists']])
+                    ,'track_artist_ids'   : artist_ids
+                    ,'track_artist_names' : artist_names
                     ,'disc_number'        : track['disc_number']
                     ,'track_number'       : track['track_number']
                     ,'track_is_playable'  : track['is_playable']
                     ,'track_length'       : round(track['duration_ms']/1000)
-                } 
-                for track in response.json()['items']
-            ]
-            tracks += data
-            if len(tracks) == response.json()['total']:
-                break
-            else:
-                params['offset'] += 50
+                })
+            return records
+        pages = await self._paginate(url, params, parse_page, session)
+
+        return list(itertools.chain.from_iterable(pages))
 
-        return tracks
-    
     @check_access_token
-    def get_several_albums_tracks(self,album_ids:list):
+    def get_albums_tracks(self, album_id:str):
         """
-        Generate a Pandas DataFrame of all the tracks in the specified album(s)
+        Generate a list of dictionaries for all the tracks in the specified album
 
         Parameters
         ----------
-        album_ids : A list of album Spotify IDs
-        """  
+        album_id : The Spotify ID of the album
+        """
+        return asyncio.run(self._get_albums_tracks_async(album_id))
+
+    async def _get_several_albums_tracks_async(self, album_ids, session = None):
+        """
+        Async counterpart of get_several_albums_tracks, reusing an open aiohttp session when given one
+        """
+        if session is None:
+            connector = aiohttp.TCPConnector(limit_per_host = 16)
+            async with aiohttp.ClientSession(connector = connector) as session:
+                return await self._get_several_albums_tracks_async(album_ids, session)
+
         #Define GET request details
         url = 'https://api.spotify.com/v1/albums'
-        headers = {
-            'Authorization': 'Bearer ' + self.access_token
-        }
         params = {
             'ids'       : album_ids
             ,'market'   : 'US'
         }
 
         #Generate full list of tracks associated with albums
-        response = requests.get(url, headers = headers, params = params)
-        album_list = [album for album in response.json()['albums']]
+        payload = await self._fetch_page(session, url, params)
 
         tracks = []
-        for album in album_list:
+        oversized_album_ids = []
+        for album in payload['albums']:
             if album['total_tracks'] >= album['tracks']['limit']:   #Get all tracks from album that exceeds limit
-                tracks += self.get_albums_tracks(album['id'])
+                oversized_album_ids.append(album['id'])
             else:
                 album_id = album['id']
-                tracks += [
-                    {
+                for track in album['tracks']['items']:
+                    artist_ids, artist_names = self._pack_artists(track['artists'])
+                    tracks.append({
                         'album_id'            : album_id
                         ,'track_name'         : track['name']
                         ,'track_id'           : track['id']
                         ,'track_uri'          : track['uri']
-                        ,'track_artist_ids'   : '|'.join([artist['id'] for artist in track['artists']])
-                        ,'track_artist_names' : '|'.join([artist['name'] for artist in track['artists']])
+                        ,'track_artist_ids'   : artist_ids
+                        ,'track_artist_names' : artist_names
                         ,'disc_number'        : track['disc_number']
                         ,'track_number'       : track['track_number']
                         ,'track_is_playable'  : track['is_playable']
                         ,'track_length'       : round(track['duration_ms']/1000)
-                    } 
-                    for track in album['tracks']['items']
-                ]
+                    })
+
+        #Paginate through the oversized albums concurrently
+        if oversized_album_ids:
+            overflow = await asyncio.gather(*[
+                self._get_albums_tracks_async(album_id, session)
+                for album_id in oversized_album_ids
+            ])
+            tracks += list(itertools.chain.from_iterable(overflow))
 
         return pd.DataFrame(tracks)
+
+    @check_access_token
+    def get_several_albums_tracks(self,album_ids:list):
+        """
+        Generate a Pandas DataFrame of all the tracks in the specified album(s)
+
+        Parameters
+        ----------
+        album_ids : A list of album Spotify IDs
+        """
+        return asyncio.run(self._get_several_albums_tracks_async(album_ids))
     
     @check_access_token
     def review_artist_discography(self, artist_id:str, reviewed_playlist_filepath:str):
@@ -462,41 +685,61 @@ class SpotifyAPIClient:
         pending_review_playlist_id = playlists.loc[playlists['playlist_name'] == 'Pending Review', 'playlist_id'].values[0]
         reviewed_playlist_tracks = pd.read_csv(reviewed_playlist_filepath)
 
+        #Build set lookups once so the isin filters below do not re-hash the CSV columns
+        reviewed_track_ids = set(reviewed_playlist_tracks['track_id'].to_numpy())
+        reviewed_album_ids = set(reviewed_playlist_tracks['album_id'].to_numpy())
+
         #Get all albums associated with artist
         albums = self.get_artists_albums(artist_id)
         album_count = albums.shape[0]
         print(f'{album_count} albums identified from {artist_id}.')
 
         #Remove reviewed albums
-        albums = albums.loc[~albums['album_id'].isin(reviewed_playlist_tracks['album_id'])]
+        albums = albums.loc[~albums['album_id'].isin(reviewed_album_ids)]
 
-        #Get all tracks associated with artist
-        tracks = []
-        for i in range((album_count // 20) + 1):
-            album_ids = ','.join(albums['album_id'].values[20 * i:20 * (i + 1)])
-            tracks.append(self.get_several_albums_tracks(album_ids))
-        tracks = pd.concat(tracks)
+        #Get all tracks associated with artist, fetching the 20-album chunks concurrently
+        album_ids = albums['album_id'].values
+        chunks = [','.join(album_ids[20 * i:20 * (i + 1)]) for i in range((len(album_ids) + 19) // 20)]
 
-        #Remove irrelevant tracks
-        tracks = tracks.loc[tracks['track_artist_ids'].apply(lambda x: artist_id in x)]     #Do not feature artist
-        tracks = tracks.loc[~tracks['track_id'].isin(reviewed_playlist_tracks['track_id'])] #Already reviewed
+        async def gather_chunks():
+            connector = aiohttp.TCPConnector(limit_per_host = 16)
+            async with aiohttp.ClientSession(connector = connector) as session:
+                return await asyncio.gather(*[
+                    self._get_several_albums_tracks_async(chunk, session)
+                    for chunk in chunks
+                ])
+        tracks = pd.concat(asyncio.run(gather_chunks()), ignore_index = True)
 
-        #Dedup for latest version of track
-        pending_review_tracks = tracks.loc[~tracks.duplicated(subset = ['track_name','track_artist_ids','track_length'])]
+        #Remove irrelevant tracks
+        tracks = tracks.loc[tracks['track_artist_ids'].str.contains(artist_id, regex = False, na = False)] #Do not feature artist
+        tracks = tracks.loc[~tracks['track_id'].isin(reviewed_track_ids)]                                  #Already reviewed
+
+        #Dedup for latest version of track, keeping the most recently released copy
+        tracks = tracks.merge(albums[['album_id', 'album_release_date']], on = 'album_id', how = 'left')
+        tracks['album_release_date'] = pd.to_datetime(tracks['album_release_date'], format = 'mixed', errors = 'coerce').fillna(pd.Timestamp.min)
+        latest_version_idx = tracks.groupby(['track_name', 'track_artist_ids', 'track_length'])['album_release_date'].idxmax()
+        pending_review_tracks = tracks.loc[latest_version_idx]
         
         #Confirm playlist upload
         print(f'{pending_review_tracks.shape[0]} tracks to be added to Pending Review Playlist')
         if input('Enter Y to continue: ') != 'Y':
             return
 
-        #Upload tracks to Pending Reviewed Playlist
-        track_count = pending_review_tracks.shape[0]
-        total_uploads = 0
-        for i in range((track_count // 100) + 1):
-            track_uris = pending_review_tracks['track_uri'].values[100 * i:100 * (i + 1)].tolist()
-            self.add_items_to_playlist(pending_review_playlist_id, track_uris)
-            total_uploads += len(track_uris)
-            print(f'{total_uploads} tracks successfully loaded to Playlist {pending_review_playlist_id}')
+        #Upload tracks to Pending Reviewed Playlist, sending the 100-URI batches concurrently
+        all_track_uris = pending_review_tracks['track_uri'].tolist()
+        batches = [all_track_uris[100 * i:100 * (i + 1)] for i in range((len(all_track_uris) + 99) // 100)]
+
+        async def upload_batches():
+            connector = aiohttp.TCPConnector(limit_per_host = 16)
+            async with aiohttp.ClientSession(connector = connector) as session:
+                return await asyncio.gather(*[
+                    self._add_items_async(session, pending_review_playlist_id, batch)
+                    for batch in batches
+                ])
+        statuses = asyncio.run(upload_batches())
+
+        total_uploads = sum(len(batch) for batch, status in zip(batches, statuses) if status == 201)
+        print(f'{total_uploads} tracks successfully loaded to Playlist {pending_review_playlist_id}')
 
         #Update reviewed playlist CSV
         updated_reviewed_playlist_tracks = pd.concat([reviewed_playlist_tracks,tracks[['track_id','album_id']]]).drop_duplicates(ignore_index = True)